@@ -0,0 +1,92 @@
+/*
+ * _ax_fast: optional C accelerator for the hot AX role read.
+ *
+ * PyObjC dispatches AXUIElementCopyAttributeValue through a libffi
+ * trampoline with selector resolution on every call; most of the per-call
+ * cost is that bridge, not the AX IPC itself. This module exposes
+ *
+ *     ax_get_role(pid[, timeout]) -> (error_code, role_or_None)
+ *
+ * as a direct C call. macos_ax_initializer.py uses it automatically when
+ * importable and falls back to PyObjC otherwise.
+ *
+ * Build (optional):
+ *     python setup.py build_ext --inplace
+ *
+ * License: MIT (same as the repository)
+ */
+#include <Python.h>
+#include <ApplicationServices/ApplicationServices.h>
+
+static PyObject *
+ax_get_role(PyObject *self, PyObject *args)
+{
+    long pid;
+    double timeout = 0.0;
+
+    if (!PyArg_ParseTuple(args, "l|d", &pid, &timeout))
+        return NULL;
+
+    AXError err = kAXErrorCannotComplete;
+    CFTypeRef value = NULL;
+
+    /* The AX call is a blocking IPC round-trip; let other warm-up threads
+     * run while we wait. */
+    Py_BEGIN_ALLOW_THREADS
+    AXUIElementRef app = AXUIElementCreateApplication((pid_t)pid);
+    if (app != NULL) {
+        if (timeout > 0.0)
+            AXUIElementSetMessagingTimeout(app, (float)timeout);
+        err = AXUIElementCopyAttributeValue(app, kAXRoleAttribute, &value);
+        CFRelease(app);
+    }
+    Py_END_ALLOW_THREADS
+
+    PyObject *role = NULL;
+    if (err == kAXErrorSuccess && value != NULL
+            && CFGetTypeID(value) == CFStringGetTypeID()) {
+        CFIndex length = CFStringGetLength((CFStringRef)value);
+        CFIndex size = CFStringGetMaximumSizeForEncoding(
+            length, kCFStringEncodingUTF8) + 1;
+        char *buf = PyMem_Malloc((size_t)size);
+        if (buf != NULL) {
+            if (CFStringGetCString((CFStringRef)value, buf, size,
+                                   kCFStringEncodingUTF8))
+                role = PyUnicode_FromString(buf);
+            PyMem_Free(buf);
+        }
+    }
+    if (value != NULL)
+        CFRelease(value);
+
+    if (role == NULL) {
+        if (PyErr_Occurred())
+            return NULL;
+        Py_INCREF(Py_None);
+        role = Py_None;
+    }
+
+    return Py_BuildValue("(iN)", (int)err, role);
+}
+
+static PyMethodDef ax_fast_methods[] = {
+    {"ax_get_role", ax_get_role, METH_VARARGS,
+     "ax_get_role(pid[, timeout]) -> (error_code, role_or_None)\n\n"
+     "Read the AXRole attribute of an application's AX element directly,\n"
+     "bypassing the PyObjC bridge."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef ax_fast_module = {
+    PyModuleDef_HEAD_INIT,
+    "_ax_fast",
+    "Optional C accelerator for macos_ax_initializer.",
+    -1,
+    ax_fast_methods
+};
+
+PyMODINIT_FUNC
+PyInit__ax_fast(void)
+{
+    return PyModule_Create(&ax_fast_module);
+}
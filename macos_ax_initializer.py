@@ -23,6 +23,8 @@ Usage:
     python macos_ax_initializer.py --all-running         # Initialize all running apps
     python macos_ax_initializer.py --list                # List running applications
     python macos_ax_initializer.py --quiet               # Minimal output (errors/warnings only)
+    python macos_ax_initializer.py --force               # Re-initialize even recently-warmed apps
+    python macos_ax_initializer.py --daemon              # Warm apps as they launch (event-driven)
 
 Requirements:
     - macOS with accessibility permissions granted
@@ -55,38 +57,272 @@ License: MIT
 Repository: https://github.com/luislozanogmia/macos-electron-accessibility-fix
 """
 
+import os
 import sys
 import argparse
+import atexit
+import concurrent.futures
+import functools
+import json
 import logging
+import re
 import time
-from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass
+from enum import IntEnum
+from typing import List, NamedTuple, Optional, Dict, Set, Tuple
 
+# Optional: pyahocorasick gives linear-time multi-fragment name matching.
+# Plain substring scanning remains the fallback, so it is never required.
 try:
-    from ApplicationServices import (
-        AXUIElementCreateApplication,
-        AXUIElementCopyAttributeValue,
-        AXIsProcessTrusted,
-    )
-    from AppKit import NSWorkspace
+    import ahocorasick
 except ImportError:
-    print("❌ Error: PyObjC frameworks not installed")
-    print("Install with: pip install pyobjc-framework-ApplicationServices pyobjc-framework-AppKit")
-    sys.exit(1)
+    ahocorasick = None
 
-# Handle different AX constant availability
+# Optional: the _ax_fast C extension performs the hot AX role read without
+# PyObjC's libffi trampoline. Build with: python setup.py build_ext --inplace
 try:
-    from ApplicationServices import kAXRoleAttribute
+    import _ax_fast
 except ImportError:
-    kAXRoleAttribute = "AXRole"
+    _ax_fast = None
+
+# PyObjC symbols are resolved lazily on first use. Importing AppKit triggers
+# a dyld load of several Objective-C frameworks plus a full class
+# registration pass, which dominates startup for --help and argument-error
+# paths that never touch the AX APIs.
+AXUIElementCreateApplication = None
+AXUIElementCopyAttributeValue = None
+AXUIElementCopyMultipleAttributeValues = None
+AXUIElementSetMessagingTimeout = None
+AXIsProcessTrusted = None
+NSWorkspace = None
+NSNull = None
+NSAutoreleasePool = None
+NSApplicationActivationPolicyRegular = 0
+kAXRoleAttribute = "AXRole"
+kAXTitleAttribute = "AXTitle"
+kAXWindowsAttribute = "AXWindows"
+kAXCopyMultipleAttributeValueOptionStopOnError = 1
+_AX_GET = None
+
+@functools.lru_cache(maxsize=1)
+def _load_frameworks() -> None:
+    """Import the PyObjC frameworks once, on the first call that needs them"""
+    global AXUIElementCreateApplication, AXUIElementCopyAttributeValue
+    global AXUIElementCopyMultipleAttributeValues, AXUIElementSetMessagingTimeout
+    global AXIsProcessTrusted, NSWorkspace, NSNull, NSAutoreleasePool, _AX_GET
+    global NSApplicationActivationPolicyRegular
+    global kAXRoleAttribute, kAXTitleAttribute, kAXWindowsAttribute
+    global kAXCopyMultipleAttributeValueOptionStopOnError
+
+    try:
+        from ApplicationServices import (
+            AXUIElementCreateApplication,
+            AXUIElementCopyAttributeValue,
+            AXIsProcessTrusted,
+        )
+        from AppKit import NSWorkspace, NSNull
+    except ImportError:
+        print("❌ Error: PyObjC frameworks not installed")
+        print("Install with: pip install pyobjc-framework-ApplicationServices pyobjc-framework-AppKit")
+        sys.exit(1)
+
+    try:
+        from AppKit import NSApplicationActivationPolicyRegular
+    except ImportError:
+        pass  # Keep the numeric fallback (the value is ABI-stable)
+
+    try:
+        from Foundation import NSAutoreleasePool
+    except ImportError:
+        pass  # Autoreleased objects then live until the bridge drains them
+
+    # Handle different AX constant availability
+    try:
+        from ApplicationServices import (
+            kAXRoleAttribute,
+            kAXTitleAttribute,
+            kAXWindowsAttribute,
+        )
+    except ImportError:
+        pass  # Keep the string fallbacks
+
+    try:
+        from ApplicationServices import AXUIElementSetMessagingTimeout
+    except ImportError:
+        pass  # Older bindings: apps keep the system default timeout
+
+    try:
+        from ApplicationServices import AXUIElementCopyMultipleAttributeValues
+    except ImportError:
+        pass  # Older bindings: fall back to single-attribute reads
+
+    try:
+        from ApplicationServices import kAXCopyMultipleAttributeValueOptionStopOnError
+    except ImportError:
+        pass  # Keep the numeric fallback
+
+    _AX_GET = _detect_ax_getter()
+
+def _detect_ax_getter():
+    """
+    Probe which AXUIElementCopyAttributeValue signature this PyObjC build
+    exposes and bind a caller that returns (error_code, value) directly.
+
+    Both the argument count and the tuple-vs-scalar return shape are fixed
+    per build, so deciding them once here keeps TypeError dispatch and the
+    isinstance normalization out of every AX read.
+    """
+    probe_element = AXUIElementCreateApplication(os.getpid())
+    try:
+        result = AXUIElementCopyAttributeValue(probe_element, kAXRoleAttribute, None)
+        call = lambda element, attribute: AXUIElementCopyAttributeValue(element, attribute, None)
+    except TypeError:
+        result = AXUIElementCopyAttributeValue(probe_element, kAXRoleAttribute)
+        call = lambda element, attribute: AXUIElementCopyAttributeValue(element, attribute)
+
+    if isinstance(result, tuple) and len(result) == 2:
+        return call  # This build already returns (error_code, value)
+    return lambda element, attribute: (0, call(element, attribute))
+
+# Pids whose AX tree was successfully initialized by this process.
+# Re-reading AXRole on an already-warm app is wasted IPC for embedders that
+# re-run warm-up in a monitoring loop; the AX state persists per session.
+_WARM_PIDS: Set[int] = set()
 
-@dataclass
-class AppInfo:
+@functools.lru_cache(maxsize=1)
+def _is_process_trusted() -> bool:
+    """
+    Check (and cache) whether this process has accessibility permissions.
+
+    AXIsProcessTrusted consults the TCC database via IPC to tccd. A grant
+    cannot be revoked mid-process (macOS kills the process instead), so one
+    check per process lifetime is safe.
+    """
+    _load_frameworks()
+    return bool(AXIsProcessTrusted())
+
+def invalidate_trust_cache() -> None:
+    """
+    Forget the cached AXIsProcessTrusted result.
+
+    Lets long-running embedders re-check after the user grants
+    accessibility permissions, without restarting the process.
+    """
+    _is_process_trusted.cache_clear()
+
+@functools.lru_cache(maxsize=256)
+def _ax_element_for_pid(pid: int):
+    """
+    Create (and cache) the AXUIElementRef for a pid.
+
+    Re-running initialization for the same targets (e.g. the "Monitoring"
+    use case) would otherwise repeat the CFRef allocation and the AX
+    session handshake for every pass. PyObjC manages the CFRetain/CFRelease
+    lifetime, so cached refs stay valid; stale pids simply fail the
+    subsequent attribute read.
+    """
+    return AXUIElementCreateApplication(pid)
+
+class Status(IntEnum):
+    """Outcome of a single app initialization"""
+    SUCCESS = 0
+    PARTIAL = 1
+    FAILURE = 2
+
+class AppInfo(NamedTuple):
     """Information about a running application"""
     name: str
     pid: int
     bundle_id: str = ""
 
+    @property
+    def name_lower(self) -> str:
+        """Lowercased name for case-insensitive matching and sorting"""
+        return self.name.lower()
+
+class InitCache:
+    """
+    Persistent TTL cache of successful initializations.
+
+    Entries are keyed by bundle identifier so a record survives pid changes
+    across relaunches, and persisted as JSON under
+    ~/.cache/macos_ax_initializer/. Repeated CLI invocations within the TTL
+    then skip the AX read entirely instead of re-waking every Electron
+    renderer to rebuild its tree on each sweep.
+    """
+
+    MAX_ENTRIES = 256
+    EVICT_AFTER_TTLS = 5
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 60.0):
+        self.ttl = ttl
+        self.path = path or os.path.join(
+            os.path.expanduser('~/.cache/macos_ax_initializer'), 'state.json')
+        self._entries: Dict[str, float] = self._load()
+        self._dirty = False
+        atexit.register(self.save)
+
+    def _load(self) -> Dict[str, float]:
+        # Best-effort like save(): a missing, corrupt, or wrong-shape state
+        # file (e.g. null values, a top-level array) must never take the
+        # tool down — start fresh instead
+        try:
+            with open(self.path) as fh:
+                return {str(key): float(value) for key, value in json.load(fh).items()}
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _key(pid: int, bundle_id: str) -> str:
+        return bundle_id or 'pid:%d' % pid
+
+    def should_init(self, pid: int, bundle_id: str) -> bool:
+        """Return True unless the app was initialized within the TTL"""
+        now = time.time()
+
+        # Lazy eviction keeps the file bounded for long-lived installs
+        if len(self._entries) > self.MAX_ENTRIES:
+            cutoff = now - self.EVICT_AFTER_TTLS * self.ttl
+            self._entries = {key: ts for key, ts in self._entries.items() if ts >= cutoff}
+            self._dirty = True
+
+        last = self._entries.get(self._key(pid, bundle_id))
+        return last is None or now - last >= self.ttl
+
+    def record(self, pid: int, bundle_id: str) -> None:
+        """Record a successful initialization"""
+        self._entries[self._key(pid, bundle_id)] = time.time()
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache (best-effort; never fails the run)"""
+        if not self._dirty:
+            return
+        try:
+            # Merge with what is on disk first so a save never discards
+            # newer records written by another instance or process
+            for key, timestamp in self._load().items():
+                if timestamp > self._entries.get(key, 0.0):
+                    self._entries[key] = timestamp
+
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w') as fh:
+                json.dump(self._entries, fh)
+            self._dirty = False
+        except OSError:
+            pass
+
+@functools.lru_cache(maxsize=1)
+def _shared_init_cache() -> InitCache:
+    """
+    One InitCache (and one atexit save) per process.
+
+    Like _WARM_PIDS, the warm state is process-scoped: per-instance caches
+    would each re-read the JSON file and stack atexit handlers, and the
+    oldest instance's save — run last by atexit — could clobber newer
+    records.
+    """
+    return InitCache()
+
 class AXInitializer:
     """
     Handles accessibility tree initialization for macOS applications.
@@ -101,31 +337,61 @@ class AXInitializer:
         'claude', 'chatgpt', 'slack', 'discord', 'notion', 'cursor',
         'visual studio code', 'spotify', 'whatsapp', 'telegram',
         'figma', 'obsidian', 'typora', 'mark text'
+    } | {
+        # Users can extend the list at startup (comma-separated names);
+        # extra fragments fold into the compiled pattern below, so they
+        # cost nothing per app at match time
+        name.strip().lower()
+        for name in os.environ.get('AX_INITIALIZER_APPS', '').split(',')
+        if name.strip()
     }
-    
-    def __init__(self, verbose: bool = True):
+
+    # Background helper processes skipped during initialization; one
+    # compiled case-insensitive scan replaces per-fragment substring tests
+    _HELPER_RE = re.compile(r'helper|networking|service', re.IGNORECASE)
+
+    # Compiled once at class definition: a single C-level scan per app name
+    # replaces a Python-level loop over every known Electron fragment.
+    _ELECTRON_PATTERN = re.compile(
+        '|'.join(re.escape(name) for name in sorted(ELECTRON_APPS)),
+        re.IGNORECASE
+    )
+
+    def __init__(self, verbose: bool = True, max_workers: int = 8, force: bool = False,
+                 timeout_sec: float = 0.5):
         self.verbose = verbose
+        self.max_workers = max_workers
+        self.force = force
+        self.timeout_sec = timeout_sec
         self.logger = self._setup_logging()
+        self._apps_cache: Optional[List[AppInfo]] = None
+        self._init_cache = _shared_init_cache()
         
     def _setup_logging(self) -> logging.Logger:
         """Configure logging for the initializer"""
         logger = logging.getLogger('ax_initializer')
-        handler = logging.StreamHandler()
-        
+        logger.propagate = False  # Avoid double delivery through the root logger
+
         if self.verbose:
             logger.setLevel(logging.INFO)
             formatter = logging.Formatter('%(message)s')
         else:
             logger.setLevel(logging.WARNING)
             formatter = logging.Formatter('[%(levelname)s] %(message)s')
-            
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+        # The logger is module-scoped; guard so repeated AXInitializer
+        # construction does not stack handlers and multiply every log line
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        else:
+            logger.handlers[0].setFormatter(formatter)
         return logger
     
     def check_accessibility_permissions(self) -> bool:
         """Check if accessibility permissions are granted"""
-        if not AXIsProcessTrusted():
+        if not _is_process_trusted():
             self.logger.error("❌ Accessibility permissions not granted")
             self.logger.error("Go to: System Preferences → Security & Privacy → Privacy → Accessibility")
             self.logger.error("Add and enable your terminal application or Python")
@@ -133,58 +399,153 @@ class AXInitializer:
         
         self.logger.info("✅ Accessibility permissions confirmed")
         return True
-    
+
+    @staticmethod
+    def _is_background_helper(name: str) -> bool:
+        """True for helper/background processes with no useful AX tree"""
+        return AXInitializer._HELPER_RE.search(name) is not None
+
     def get_running_applications(self) -> List[AppInfo]:
-        """Get list of all running applications"""
-        workspace = NSWorkspace.sharedWorkspace()
-        running_apps = workspace.runningApplications()
-        
-        apps = []
-        for app in running_apps:
-            if app.localizedName():
-                apps.append(AppInfo(
-                    name=app.localizedName(),
-                    pid=app.processIdentifier(),
-                    bundle_id=app.bundleIdentifier() or ""
-                ))
-        
-        return sorted(apps, key=lambda x: x.name.lower())
+        """Get list of all running applications (cached per instance)"""
+        # Querying NSWorkspace re-allocates the whole NSRunningApplication
+        # array and re-crosses the PyObjC bridge per attribute, so one
+        # enumeration is reused for the lifetime of this initializer.
+        if self._apps_cache is not None:
+            return self._apps_cache
+
+        _load_frameworks()
+
+        # An explicit pool drains the autoreleased NSArrays/NSStrings from
+        # the enumeration when we are done with them; without one, a script
+        # invocation may never spin a runloop to release them. AppInfo only
+        # holds Python copies (str/int), so nothing outlives the pool.
+        pool = NSAutoreleasePool.alloc().init() if NSAutoreleasePool is not None else None
+        try:
+            workspace = NSWorkspace.sharedWorkspace()
+            running_apps = workspace.runningApplications()
+
+            # Key-value coding extracts each attribute for the whole array in a
+            # single bridge crossing instead of three libffi trampolines per app.
+            names = running_apps.valueForKey_("localizedName")
+            pids = running_apps.valueForKey_("processIdentifier")
+            bundle_ids = running_apps.valueForKey_("bundleIdentifier")
+            policies = running_apps.valueForKey_("activationPolicy")
+
+            null = NSNull.null()  # KVC substitutes NSNull for nil attributes
+            apps = []
+            for name, pid, bundle_id, policy in zip(names, pids, bundle_ids, policies):
+                # Only regular-policy apps are user-facing; background agents
+                # and daemons have no AX tree and each would cost a failing IPC
+                # round-trip to warm up.
+                if name and name is not null and int(policy) == NSApplicationActivationPolicyRegular:
+                    apps.append(AppInfo(
+                        name=str(name),
+                        pid=int(pid),
+                        bundle_id="" if bundle_id is null else str(bundle_id or "")
+                    ))
+        finally:
+            del pool
+
+        # Returned in workspace order; only --list needs a sorted view, and
+        # sorting here would cost O(N log N) plus N lowercased names for the
+        # warm-up paths that just scan for matches.
+        self._apps_cache = apps
+        return self._apps_cache
     
+    def _iter_running_apps_minimal(self):
+        """
+        Yield (name, pid) for user-facing running applications.
+
+        The --list display needs neither bundle identifiers nor AppInfo
+        records, so this skips that work (and the warm-up path's
+        per-instance cache) entirely.
+        """
+        _load_frameworks()
+        running_apps = NSWorkspace.sharedWorkspace().runningApplications()
+        names = running_apps.valueForKey_("localizedName")
+        pids = running_apps.valueForKey_("processIdentifier")
+        policies = running_apps.valueForKey_("activationPolicy")
+
+        null = NSNull.null()
+        for name, pid, policy in zip(names, pids, policies):
+            if name and name is not null and int(policy) == NSApplicationActivationPolicyRegular:
+                yield str(name), int(pid)
+
     def find_apps_by_names(self, target_names: List[str]) -> List[AppInfo]:
-        """Find running applications by name (case-insensitive partial matching)"""
+        """
+        Find running applications by name (case-insensitive partial matching).
+
+        Every app matching any target is returned, so e.g. two running apps
+        that both contain "chrome" are both initialized.
+        """
         all_apps = self.get_running_applications()
-        found_apps = []
-        
-        for target in target_names:
-            target_lower = target.lower()
-            for app in all_apps:
-                if target_lower in app.name.lower():
-                    found_apps.append(app)
-                    break
-        
-        return found_apps
+        targets_lower = [target.lower() for target in target_names]
+
+        # One pass over the app list, lowercasing each name exactly once.
+        # With pyahocorasick installed all fragments are matched in a single
+        # linear scan per name; otherwise fall back to substring tests.
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for target in targets_lower:
+                automaton.add_word(target, target)
+            automaton.make_automaton()
+            matches = lambda name_lower: any(True for _ in automaton.iter(name_lower))
+        else:
+            matches = lambda name_lower: any(target in name_lower for target in targets_lower)
+
+        return [app for app in all_apps if matches(app.name_lower)]
     
     def _ax_get_role_robust(self, app_element) -> Tuple[int, Optional[str]]:
         """
-        Robust AX role attribute getter using 2-argument API.
-        
-        Handles the AXUIElementCopyAttributeValue signature that accepts two arguments,
-        per updated macOS API usage and PyObjC bindings.
+        Robust AX role attribute getter.
+
+        Dispatches through the module-level _AX_GET binding, which was
+        selected at probe time and already normalizes the return to
+        (error_code, value) for this PyObjC build.
         """
         try:
-            result = AXUIElementCopyAttributeValue(app_element, kAXRoleAttribute)
-            
-            if isinstance(result, tuple) and len(result) == 2:
-                error_code, role_value = result
-                return error_code, role_value
-            else:
-                return 0, result
-                
+            return _AX_GET(app_element, kAXRoleAttribute)
         except Exception as e:
-            self.logger.debug(f"AX role read failed: {e}")
+            self.logger.debug("AX role read failed: %s", e)
             return -25212, None  # Return the specific error code we're addressing
     
-    def initialize_app_accessibility(self, app_info: AppInfo) -> str:
+    def _ax_warm_attributes(self, app_element) -> Tuple[int, Optional[str]]:
+        """
+        Warm the application element by reading several attributes at once.
+
+        AXUIElementCopyMultipleAttributeValues collapses one XPC round-trip
+        per attribute into a single message, so reading AXTitle and
+        AXWindows alongside AXRole materializes more of the tree per trip.
+        Falls back to the single-attribute getter on bindings without the
+        batched API. Returns the (error_code, role) contract of
+        _ax_get_role_robust.
+        """
+        if AXUIElementCopyMultipleAttributeValues is not None:
+            attributes = (kAXRoleAttribute, kAXTitleAttribute, kAXWindowsAttribute)
+            try:
+                result = AXUIElementCopyMultipleAttributeValues(
+                    app_element, attributes,
+                    kAXCopyMultipleAttributeValueOptionStopOnError, None)
+            except Exception as e:
+                self.logger.debug("Batched AX read failed: %s", e)
+            else:
+                if isinstance(result, tuple) and len(result) == 2:
+                    error_code, values = result
+                else:
+                    error_code, values = 0, result
+                if error_code == 0 and values:
+                    # Without StopOnError honored, a failed attribute comes
+                    # back as an AXValue error sentinel inside the array;
+                    # only a real string role counts as success
+                    role = values[0]  # AXRole is first in the tuple
+                    if isinstance(role, str):
+                        return 0, str(role)
+                    return -25212, None
+                return error_code or -25212, None
+
+        return self._ax_get_role_robust(app_element)
+
+    def initialize_app_accessibility(self, app_info: AppInfo) -> Status:
         """
         Initialize accessibility tree for a specific application.
         
@@ -192,35 +553,72 @@ class AXInitializer:
         the accessibility system to build and cache the UI element tree.
         
         Returns:
-            'success' if fully initialized,
-            'partial' if error -25212 encountered,
-            'failure' otherwise.
+            Status.SUCCESS if fully initialized,
+            Status.PARTIAL if error -25212 encountered,
+            Status.FAILURE otherwise.
         """
+        if app_info.pid in _WARM_PIDS:
+            self.logger.debug("Skipping %s (PID %d): already warm this session", app_info.name, app_info.pid)
+            return Status.SUCCESS
+
+        # The persistent cache covers repeated CLI invocations (e.g. a
+        # monitoring timer), where _WARM_PIDS cannot help
+        if not self.force and not self._init_cache.should_init(app_info.pid, app_info.bundle_id):
+            self.logger.debug("Skipping %s: initialized within the last %.0fs", app_info.name, self._init_cache.ttl)
+            return Status.SUCCESS
+
         try:
-            self.logger.info(f"🎯 Initializing accessibility for {app_info.name} (PID: {app_info.pid})")
-            
-            # Create accessibility application element
-            app_element = AXUIElementCreateApplication(app_info.pid)
-            
+            # Per-app lines log at DEBUG: under the thread-pool fan-out the
+            # handler lock would otherwise serialize concurrent warm-ups on
+            # TTY I/O. The aggregate summary stays at INFO.
+            self.logger.debug("🎯 Initializing accessibility for %s (PID: %d)", app_info.name, app_info.pid)
+
+            if _ax_fast is not None:
+                # Direct C call: skips the libffi trampoline and selector
+                # lookup; the extension applies the messaging timeout itself
+                read_role = lambda: _ax_fast.ax_get_role(app_info.pid, self.timeout_sec)
+            else:
+                # Create (or reuse) the accessibility application element
+                _load_frameworks()
+                app_element = _ax_element_for_pid(app_info.pid)
+
+                # Cap AX round-trips for this element so one hung app cannot
+                # stall the pass for the system default timeout (~6s)
+                if AXUIElementSetMessagingTimeout is not None:
+                    AXUIElementSetMessagingTimeout(app_element, self.timeout_sec)
+
+                read_role = lambda: self._ax_warm_attributes(app_element)
+
             # Force accessibility tree initialization by reading the role attribute
             # This is the critical step that creates session-persistent state
-            error_code, role = self._ax_get_role_robust(app_element)
-            
+            #
+            # Back-pressure is applied only where the daemon signals it:
+            # -25212 is retried a couple of times with a short exponential
+            # backoff instead of a blanket inter-app throttle.
+            error_code, role = read_role()
+            for attempt in range(2):
+                if error_code != -25212:
+                    break
+                time.sleep(0.01 * 2 ** attempt)
+                error_code, role = read_role()
+
             if error_code == 0 and role:
-                self.logger.info(f"✅ Accessibility initialized successfully: {role}")
-                return 'success'
+                _WARM_PIDS.add(app_info.pid)
+                self._init_cache.record(app_info.pid, app_info.bundle_id)
+                self.logger.debug("✅ Accessibility initialized successfully: %s", role)
+                return Status.SUCCESS
             elif error_code == -25212:
-                self.logger.warning(f"⚠️  Error -25212 detected - accessibility may be partial")
-                return 'partial'
+                self.logger.warning("⚠️  Error -25212 detected - accessibility may be partial")
+                return Status.PARTIAL
             else:
-                self.logger.warning(f"⚠️  Accessibility init returned error code: {error_code}")
-                return 'failure'
+                self.logger.warning("⚠️  Accessibility init returned error code: %s", error_code)
+                return Status.FAILURE
                 
         except Exception as e:
-            self.logger.error(f"❌ Failed to initialize accessibility for {app_info.name}: {e}")
-            return 'failure'
+            self.logger.error("❌ Failed to initialize accessibility for %s: %s", app_info.name, e)
+            return Status.FAILURE
     
-    def initialize_multiple_apps(self, app_infos: List[AppInfo]) -> Dict[str, str]:
+    def initialize_multiple_apps(self, app_infos: List[AppInfo]) -> Dict[str, Status]:
         """Initialize accessibility for multiple applications"""
         results = {}
         
@@ -229,58 +627,122 @@ class AXInitializer:
             return results
         
         # Filter out background helper processes
-        filtered_apps = [
-            app for app in app_infos
-            if not any(substr.lower() in app.name.lower() for substr in ("Helper", "Networking", "Service"))
-        ]
-        skipped_apps = [app for app in app_infos if app not in filtered_apps]
-        
-        self.logger.info(f"🔧 Initializing accessibility for {len(filtered_apps)} applications (skipped {len(skipped_apps)} helper/background apps)...")
-        
-        for app_info in filtered_apps:
-            status = self.initialize_app_accessibility(app_info)
-            results[app_info.name] = status
-            
-            # Small delay between initializations to avoid overwhelming the system
-            time.sleep(0.1)
-        
-        # Summary
-        successful = [name for name, stat in results.items() if stat == 'success']
-        partials = [name for name, stat in results.items() if stat == 'partial']
-        failures = [name for name, stat in results.items() if stat == 'failure']
-        skipped = [app.name for app in skipped_apps]
+        filtered_apps = []
+        skipped_apps = []
+        for app in app_infos:
+            if self._is_background_helper(app.name):
+                skipped_apps.append(app)
+            else:
+                filtered_apps.append(app)
+
+        # Evict pids that are no longer running so a relaunched app (new
+        # pid) is warmed again and the warm set cannot grow without bound
+        _WARM_PIDS.intersection_update(app.pid for app in self.get_running_applications())
         
-        self.logger.info(f"🎉 Accessibility initialization complete: {len(successful)}/{len(filtered_apps)} successful")
-        if successful:
-            self.logger.info(f"✅ Successes: {', '.join(successful)}")
-        if partials:
-            self.logger.info(f"⚠️  Partial: {', '.join(partials)}")
-        if failures:
-            self.logger.info(f"❌ Failures: {', '.join(failures)}")
-        if skipped:
-            self.logger.info(f"⏭️  Skipped helper/background apps: {', '.join(skipped)}")
+        self.logger.info("🔧 Initializing accessibility for %d applications (skipped %d helper/background apps)...", len(filtered_apps), len(skipped_apps))
         
+        # Each AX read is an IPC round-trip to universalaccessd, so the work is
+        # I/O-bound, not CPU-bound. PyObjC releases the GIL while the bridge
+        # call is in flight, so fanning the apps out across threads lets slow
+        # apps overlap instead of gating fast ones.
+        if filtered_apps:
+            max_workers = min(self.max_workers, len(filtered_apps))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_map = {
+                    executor.submit(self.initialize_app_accessibility, app): app
+                    for app in filtered_apps
+                }
+                for future in concurrent.futures.as_completed(future_map):
+                    results[future_map[future].name] = future.result()
+
+        # Summary — skipped wholesale under --quiet so the name lists are
+        # never even assembled when INFO is filtered out
+        if self.logger.isEnabledFor(logging.INFO):
+            # One pass with integer-indexed buckets instead of three
+            # scans doing string comparisons
+            buckets = ([], [], [])  # Indexed by Status value
+            for name, status in results.items():
+                buckets[status].append(name)
+            successful, partials, failures = buckets
+            skipped = [app.name for app in skipped_apps]
+
+            self.logger.info("🎉 Accessibility initialization complete: %d/%d successful", len(successful), len(filtered_apps))
+            if successful:
+                self.logger.info("✅ Successes: %s", ", ".join(successful))
+            if partials:
+                self.logger.info("⚠️  Partial: %s", ", ".join(partials))
+            if failures:
+                self.logger.info("❌ Failures: %s", ", ".join(failures))
+            if skipped:
+                self.logger.info("⏭️  Skipped helper/background apps: %s", ", ".join(skipped))
+
         return results
     
-    def initialize_electron_apps(self) -> Dict[str, str]:
+    def initialize_electron_apps(self) -> Dict[str, Status]:
         """Initialize accessibility for known Electron applications"""
         all_apps = self.get_running_applications()
         
         electron_apps = []
         for app in all_apps:
-            if any(electron_name in app.name.lower() for electron_name in self.ELECTRON_APPS):
-                # Skip background helper processes
-                if any(substr.lower() in app.name.lower() for substr in ("Helper", "Networking", "Service")):
-                    continue
+            # Helper processes are filtered once, by initialize_multiple_apps
+            if self._ELECTRON_PATTERN.search(app.name):
                 electron_apps.append(app)
         
         if not electron_apps:
             self.logger.info("ℹ️  No known Electron applications running")
             return {}
         
-        self.logger.info(f"Found {len(electron_apps)} Electron applications: {', '.join(app.name for app in electron_apps)}")
+        self.logger.info("Found %d Electron applications: %s", len(electron_apps), ", ".join(app.name for app in electron_apps))
         return self.initialize_multiple_apps(electron_apps)
 
+    def run_daemon(self) -> int:
+        """
+        Event-driven mode: warm each app as it launches instead of polling.
+
+        Periodic re-runs force every Electron app to rebuild its AX tree on
+        each sweep. Subscribing to NSWorkspaceDidLaunchApplicationNotification
+        instead costs zero CPU while idle and warms new apps within
+        milliseconds of launch. Blocks on the main run loop until
+        interrupted.
+        """
+        _load_frameworks()
+        from AppKit import (
+            NSWorkspaceDidLaunchApplicationNotification,
+            NSWorkspaceApplicationKey,
+        )
+        from Foundation import NSRunLoop, NSDate, NSDefaultRunLoopMode
+
+        def _on_launch(notification):
+            app = notification.userInfo()[NSWorkspaceApplicationKey]
+            name = str(app.localizedName() or "")
+            if not name or self._is_background_helper(name):
+                return
+            self.initialize_app_accessibility(AppInfo(
+                name=name,
+                pid=int(app.processIdentifier()),
+                bundle_id=str(app.bundleIdentifier() or "")
+            ))
+
+        center = NSWorkspace.sharedWorkspace().notificationCenter()
+        observer = center.addObserverForName_object_queue_usingBlock_(
+            NSWorkspaceDidLaunchApplicationNotification, None, None, _on_launch)
+
+        self.logger.info("👀 Daemon mode: warming apps as they launch (Ctrl-C to stop)")
+        try:
+            # Spin the run loop in short slices so control returns to Python
+            # between events: a pending SIGINT is only raised as
+            # KeyboardInterrupt when bytecode executes, which a bare
+            # NSRunLoop.run() never yields back to.
+            run_loop = NSRunLoop.mainRunLoop()
+            while True:
+                run_loop.runMode_beforeDate_(
+                    NSDefaultRunLoopMode, NSDate.dateWithTimeIntervalSinceNow_(0.5))
+        except KeyboardInterrupt:
+            self.logger.info("Daemon mode stopped")
+        finally:
+            center.removeObserver_(observer)
+        return 0
+
 def main():
     """Command-line interface for the AX initializer"""
     parser = argparse.ArgumentParser(
@@ -293,6 +755,8 @@ Examples:
   %(prog)s --all-running            # Initialize all running apps
   %(prog)s --list                   # List running applications
   %(prog)s --quiet                  # Run with minimal output
+  %(prog)s --force                  # Re-initialize even recently-warmed apps
+  %(prog)s --daemon                 # Warm apps as they launch (event-driven)
 
 This utility addresses the notorious error -25212 (kAXErrorCannotComplete) 
 that affects automation tools working with Electron applications.
@@ -300,8 +764,9 @@ that affects automation tools working with Electron applications.
     )
     
     parser.add_argument(
-        '--apps', 
-        nargs='+', 
+        '--apps',
+        nargs='+',
+        type=str.lower,  # Normalize once at parse time
         help='Specific application names to initialize (case-insensitive partial matching)'
     )
     parser.add_argument(
@@ -315,15 +780,25 @@ that affects automation tools working with Electron applications.
         help='List all running applications and exit'
     )
     parser.add_argument(
-        '--quiet', 
+        '--quiet',
         action='store_true',
         help='Minimize output (errors and warnings only)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-initialize apps even if they were initialized recently'
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Stay running and warm each app as it launches (event-driven, no polling)'
+    )
     
     args = parser.parse_args()
     
     # Initialize the AX initializer
-    initializer = AXInitializer(verbose=not args.quiet)
+    initializer = AXInitializer(verbose=not args.quiet, force=args.force)
     
     # Check accessibility permissions first
     if not initializer.check_accessibility_permissions():
@@ -331,20 +806,26 @@ that affects automation tools working with Electron applications.
     
     # Handle list command
     if args.list:
-        apps = initializer.get_running_applications()
+        apps = sorted(initializer._iter_running_apps_minimal(), key=lambda item: item[0].lower())
         print("\n📱 Running Applications:")
         print("-" * 50)
-        for app in apps:
-            print(f"{app.name:<30} (PID: {app.pid})")
+        for name, pid in apps:
+            print(f"{name:<30} (PID: {pid})")
         print(f"\nTotal: {len(apps)} applications")
         return 0
     
+    # Handle daemon mode: warm what is already running, then wait for
+    # launch notifications instead of polling
+    if args.daemon:
+        initializer.initialize_electron_apps()
+        return initializer.run_daemon()
+
     # Handle specific apps
     if args.apps:
         target_apps = initializer.find_apps_by_names(args.apps)
         
         if not target_apps:
-            initializer.logger.error(f"❌ No running applications found matching: {', '.join(args.apps)}")
+            initializer.logger.error("❌ No running applications found matching: %s", ", ".join(args.apps))
             return 1
         
         results = initializer.initialize_multiple_apps(target_apps)
@@ -359,7 +840,7 @@ that affects automation tools working with Electron applications.
         results = initializer.initialize_electron_apps()
     
     # Return appropriate exit code
-    if results and any(status == 'success' for status in results.values()):
+    if results and any(status is Status.SUCCESS for status in results.values()):
         return 0  # At least one success
     else:
         return 1  # No successes or no apps processed
@@ -367,4 +848,4 @@ that affects automation tools working with Electron applications.
 if __name__ == "__main__":
     sys.exit(main())
 
-__all__ = ["AXInitializer", "AppInfo", "main"]
\ No newline at end of file
+__all__ = ["AXInitializer", "AppInfo", "InitCache", "Status", "invalidate_trust_cache", "main"]
\ No newline at end of file
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Build script for the optional _ax_fast C accelerator.
+
+The initializer works without it (falling back to PyObjC); building the
+extension removes the libffi bridge overhead from the hot AX role read:
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup, Extension
+
+setup(
+    name="macos-ax-fast",
+    version="1.1",
+    description="Optional C accelerator for macos_ax_initializer",
+    ext_modules=[
+        Extension(
+            "_ax_fast",
+            sources=["_ax_fast.c"],
+            extra_link_args=["-framework", "ApplicationServices"],
+        )
+    ],
+)